@@ -0,0 +1,99 @@
+"""
+In-process response caching for the Agentic Platform.
+Keeps pre-encoded response bodies with an ETag, invalidated by a data
+version that changes on every write to the people table, whichever worker
+process made it.
+"""
+
+import hashlib
+import time
+from typing import Optional, Tuple
+
+from app.database import get_shared_db
+
+# Incremented on every create/update/delete of a person in this process
+_data_version = 0
+
+# (local write counter, SQLite PRAGMA data_version of the shared writer)
+DataVersion = Tuple[int, int]
+
+
+def bump_data_version() -> None:
+    """Invalidate all cached responses after a write."""
+    global _data_version
+    _data_version += 1
+
+
+async def get_data_version() -> DataVersion:
+    """
+    Return the current data version.
+    SQLite's data_version changes when any other connection commits, which
+    covers writes made by other worker processes; this process's own writes
+    on the shared writer are counted by bump_data_version.
+    """
+    db = await get_shared_db()
+    cursor = await db.execute("PRAGMA data_version;")
+    row = await cursor.fetchone()
+    return _data_version, row[0]
+
+
+def compute_etag(data: bytes) -> str:
+    """
+    Compute a weak ETag for the data behind a response.
+    Weak because the tag covers the data rather than the exact bytes: bodies
+    may carry per-refill fields and GZipMiddleware may re-encode them.
+    """
+    return f'W/"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+
+
+def _opaque_tag(tag: str) -> str:
+    """Strip the weak indicator so tags can be compared weakly."""
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Check an If-None-Match request header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    candidates = [_opaque_tag(tag) for tag in if_none_match.split(",")]
+    return "*" in candidates or _opaque_tag(etag) in candidates
+
+
+class ResponseCache:
+    """
+    Single-entry cache for an encoded response body.
+    An entry is served until its TTL expires or the data version changes.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entry: Optional[Tuple[float, DataVersion, bytes, str]] = None
+
+    def get(self, version: DataVersion) -> Optional[Tuple[bytes, str]]:
+        """Return (body, etag) if an entry fresh for version exists, otherwise None."""
+        if self._entry is None:
+            return None
+
+        expires_at, entry_version, body, etag = self._entry
+        if entry_version != version or time.monotonic() >= expires_at:
+            self._entry = None
+            return None
+        return body, etag
+
+    def set(self, body: bytes, version: DataVersion,
+            etag_source: Optional[bytes] = None) -> Tuple[bytes, str]:
+        """
+        Store an encoded body and return it with its ETag.
+
+        Args:
+            body: Encoded response body
+            version: Data version read before the body was queried, so a
+                write racing the query leaves the entry already stale
+            etag_source: Bytes to hash for the ETag instead of the body, for
+                bodies that carry per-refill fields such as a timestamp;
+                the weak tag then marks the bodies as equivalent, not identical
+        """
+        etag = compute_etag(body if etag_source is None else etag_source)
+        self._entry = (time.monotonic() + self.ttl, version, body, etag)
+        return body, etag
@@ -3,75 +3,295 @@ Database connection utilities and schema management for the Agentic Platform.
 Provides SQLite database initialization and connection management.
 """
 
+import asyncio
 import aiosqlite
 import os
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 from contextlib import asynccontextmanager
 
 # Database file path
 DATABASE_PATH = os.path.join(os.path.dirname(
     os.path.dirname(__file__)), "agentic_platform.db")
 
+# Current UTC time as ISO 8601 text ("T" separated, millisecond precision).
+# Every writer stamps created_at/updated_at with it, so the columns sort
+# correctly as text
+SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%f', 'now')"
+
 # SQL schema for People table
-PEOPLE_TABLE_SCHEMA = """
+PEOPLE_TABLE_SCHEMA = f"""
 CREATE TABLE IF NOT EXISTS people (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     name TEXT NOT NULL,
     role TEXT NOT NULL,
     department TEXT NOT NULL,
     staffing_status TEXT NOT NULL CHECK (staffing_status IN ('staffed', 'bench', 'available')),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT ({SQL_NOW}),
+    updated_at TIMESTAMP DEFAULT ({SQL_NOW})
 );
 """
 
-# Index for performance on common queries
-PEOPLE_TABLE_INDEXES = """
-CREATE INDEX IF NOT EXISTS idx_people_staffing_status ON people(staffing_status);
-CREATE INDEX IF NOT EXISTS idx_people_department ON people(department);
+# Indexes for performance on common queries, keyed by index name
+PEOPLE_TABLE_INDEXES = {
+    "idx_people_department": "CREATE INDEX IF NOT EXISTS idx_people_department ON people(department);",
+    # Partial index over only the rows the beach endpoint reads, in its
+    # created_at DESC order
+    "idx_people_on_beach_created": "CREATE INDEX IF NOT EXISTS idx_people_on_beach_created ON people(created_at DESC) WHERE staffing_status IN ('bench', 'available');",
+    # Serves both the staffing_status filter and the created_at DESC ordering
+    "idx_people_status_created": "CREATE INDEX IF NOT EXISTS idx_people_status_created ON people(staffing_status, created_at DESC);",
+}
+
+# Indexes from earlier schema versions, dropped from existing databases: a
+# redundant prefix of idx_people_status_created, a partial index on id the
+# planner never chose, and a beach covering index replaced by
+# idx_people_on_beach_created
+SUPERSEDED_INDEXES = ("idx_people_staffing_status", "idx_people_on_beach", "idx_people_beach_cover")
+
+# Columns of the people table, selected explicitly rather than with *
+PEOPLE_COLUMNS = "id, name, role, department, staffing_status, created_at, updated_at"
+
+# Hot-path statements kept as constants so every call passes identical SQL
+# text and hits the sqlite3 prepared-statement cache
+# Newest first by rowid, which follows insertion order and needs no sort step
+SQL_LIST_PEOPLE = f"""
+SELECT {PEOPLE_COLUMNS}
+FROM people
+ORDER BY id DESC
+"""
+
+SQL_GET_PERSON = f"""
+SELECT {PEOPLE_COLUMNS}
+FROM people WHERE id = ?
+"""
+
+# Timestamps are set explicitly so tables created with the older
+# CURRENT_TIMESTAMP defaults still get the ISO 8601 format
+SQL_INSERT_PERSON = f"""
+INSERT INTO people (name, role, department, staffing_status, created_at, updated_at)
+VALUES (?, ?, ?, ?, {SQL_NOW}, {SQL_NOW})
+RETURNING {PEOPLE_COLUMNS}
+"""
+
+SQL_UPDATE_PERSON = f"""
+UPDATE people SET
+    name = COALESCE(?, name),
+    role = COALESCE(?, role),
+    department = COALESCE(?, department),
+    staffing_status = COALESCE(?, staffing_status),
+    updated_at = {SQL_NOW}
+WHERE id = ?
+RETURNING {PEOPLE_COLUMNS}
+"""
+
+SQL_DELETE_PERSON = f"""
+DELETE FROM people WHERE id = ?
+RETURNING {PEOPLE_COLUMNS}
+"""
+
+SQL_BEACH = f"""
+SELECT {PEOPLE_COLUMNS} FROM people
+WHERE staffing_status IN ('bench', 'available')
+ORDER BY created_at DESC
+"""
+
+SQL_PEOPLE_BY_STATUS = f"""
+SELECT {PEOPLE_COLUMNS} FROM people WHERE staffing_status = ? ORDER BY created_at DESC
+"""
+
+# Total and on-beach counts in a single table scan
+SQL_COUNTS = """
+SELECT
+    COUNT(*) as total,
+    COALESCE(SUM(CASE WHEN staffing_status IN ('bench', 'available') THEN 1 ELSE 0 END), 0) as beach_total
+FROM people
 """
 
+# Prepared statements kept per connection by sqlite3, keyed by SQL text
+STATEMENT_CACHE_SIZE = 128
+
+# Write-side settings; journal_mode cannot be changed on a read-only
+# connection, so these are applied to writers only
+SQLITE_WRITER_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+)
 
-async def init_database() -> None:
+# Per-connection tuning applied to every connection, readers included
+SQLITE_PRAGMAS = (
+    "PRAGMA temp_store=memory;",
+    "PRAGMA cache_size=-64000;",
+    "PRAGMA mmap_size=268435456;",
+    "PRAGMA busy_timeout=5000;",
+)
+
+# Number of read-only connections kept in the pool
+READER_POOL_SIZE = 4
+
+
+async def apply_pragmas(db: aiosqlite.Connection, read_only: bool = False) -> None:
+    """
+    Apply WAL mode and performance PRAGMAs to a connection.
+    WAL with synchronous=NORMAL avoids an fsync on every commit.
+
+    Args:
+        db: Connection to configure
+        read_only: Skip the write-side PRAGMAs for mode=ro connections
+    """
+    pragmas = SQLITE_PRAGMAS if read_only else SQLITE_WRITER_PRAGMAS + SQLITE_PRAGMAS
+    for pragma in pragmas:
+        await db.execute(pragma)
+
+
+class ConnectionPool:
+    """
+    Long-lived SQLite connections shared by all requests.
+    Holds one read-write connection and a fixed set of read-only connections,
+    so that under WAL readers never contend with each other or the writer.
+    """
+
+    def __init__(self, size: int = READER_POOL_SIZE):
+        self.size = size
+        self.writer: Optional[aiosqlite.Connection] = None
+        self._readers: asyncio.Queue = asyncio.Queue()
+        self._all_readers: list[aiosqlite.Connection] = []
+
+    async def open(self) -> None:
+        """Open the writer and all reader connections."""
+        # Autocommit mode: each write statement is its own transaction, and
+        # multi-statement work issues BEGIN/COMMIT explicitly
+        self.writer = await aiosqlite.connect(
+            DATABASE_PATH, isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE, check_same_thread=False)
+        # Enable row factory for easier data access
+        self.writer.row_factory = aiosqlite.Row
+        await apply_pragmas(self.writer)
+
+        for _ in range(self.size):
+            reader = await aiosqlite.connect(
+                f"file:{DATABASE_PATH}?mode=ro", uri=True,
+                cached_statements=STATEMENT_CACHE_SIZE,
+                check_same_thread=False)
+            reader.row_factory = aiosqlite.Row
+            await apply_pragmas(reader, read_only=True)
+            self._all_readers.append(reader)
+            self._readers.put_nowait(reader)
+
+    async def close(self) -> None:
+        """Close every connection held by the pool."""
+        for reader in self._all_readers:
+            await reader.close()
+        self._all_readers.clear()
+
+        if self.writer is not None:
+            await self.writer.close()
+            self.writer = None
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Borrow a read-only connection, returning it to the pool afterwards."""
+        db = await self._readers.get()
+        try:
+            yield db
+        finally:
+            self._readers.put_nowait(db)
+
+
+# Shared pool opened once on startup and reused by every request
+_pool: Optional[ConnectionPool] = None
+# Guards lazy opening of the pool outside the application lifespan
+_pool_lock = asyncio.Lock()
+
+
+async def init_database(db: Optional[aiosqlite.Connection] = None) -> None:
     """
     Initialize the database and create tables if they don't exist.
+    Without a connection, also opens the shared connection pool used by the
+    request dependencies and runs the DDL on its writer.
     This function should be called on application startup.
+
+    Args:
+        db: Writer connection to run the DDL on instead of opening the pool,
+            for scripts such as the seeder that do not serve requests
     """
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        # Create People table
-        await db.execute(PEOPLE_TABLE_SCHEMA)
+    global _pool
+
+    if db is None:
+        if _pool is None:
+            _pool = ConnectionPool()
+            await _pool.open()
+        db = _pool.writer
 
-        # Create indexes for performance
-        await db.execute("CREATE INDEX IF NOT EXISTS idx_people_staffing_status ON people(staffing_status);")
-        await db.execute("CREATE INDEX IF NOT EXISTS idx_people_department ON people(department);")
+    # Create People table
+    await db.execute(PEOPLE_TABLE_SCHEMA)
 
-        # Commit the changes
-        await db.commit()
+    # Bring the indexes up to date, touching only those that differ
+    cursor = await db.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'people'"
+    )
+    existing = {row[0] for row in await cursor.fetchall()}
+    stale = existing.intersection(SUPERSEDED_INDEXES)
+    missing = PEOPLE_TABLE_INDEXES.keys() - existing
 
+    for name in stale:
+        await db.execute(f"DROP INDEX IF EXISTS {name};")
+    for name in missing:
+        await db.execute(PEOPLE_TABLE_INDEXES[name])
 
-@asynccontextmanager
-async def get_database() -> AsyncGenerator[aiosqlite.Connection, None]:
+    # Refresh planner statistics only when the index set changed; the seed
+    # script re-runs ANALYZE after loading data
+    if stale or missing:
+        await db.execute("ANALYZE;")
+
+
+async def get_shared_pool() -> ConnectionPool:
+    """
+    Return the shared connection pool, opening it on first use.
+    Lets the service layer work even when init_database has not run yet.
     """
-    Async context manager for database connections.
-    Ensures proper connection handling and cleanup.
+    if _pool is None:
+        async with _pool_lock:
+            if _pool is None:
+                await init_database()
+    return _pool
 
-    Usage:
-        async with get_database() as db:
-            cursor = await db.execute("SELECT * FROM people")
-            results = await cursor.fetchall()
+
+async def get_shared_db() -> aiosqlite.Connection:
+    """Return the shared read-write connection."""
+    return (await get_shared_pool()).writer
+
+
+async def close_database() -> None:
     """
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        # Enable row factory for easier data access
-        db.row_factory = aiosqlite.Row
-        yield db
+    Close the shared connection pool.
+    This function should be called on application shutdown.
+    """
+    global _pool
+
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
 
 
-async def get_db_connection():
+async def get_db_read():
     """
-    Dependency function for FastAPI to inject database connections.
-    Used with FastAPI's dependency injection system.
+    Dependency function for FastAPI to inject a read-only connection.
+    Borrows one of the pooled readers for the duration of the request,
+    opening the pool first if the application lifespan has not.
     """
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        # Enable row factory for easier data access
-        db.row_factory = aiosqlite.Row
+    async with (await get_shared_pool()).reader() as db:
         yield db
+
+
+async def get_db_write():
+    """
+    Dependency function for FastAPI to inject the read-write connection.
+    All writes go through the single shared writer, which runs in autocommit
+    mode. Handlers must not call commit() or rollback() on it: with the
+    connection shared, a rollback in one request could discard another
+    request's write.
+    """
+    yield await get_shared_db()
+
+
+# General-purpose dependency, kept for existing callers
+get_db_connection = get_db_write
@@ -3,8 +3,8 @@ Pydantic models for the Agentic Platform.
 Defines data models with validation for API requests and responses.
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+from typing import Annotated, Literal, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -16,25 +16,19 @@ class StaffingStatus(str, Enum):
     AVAILABLE = "available"
 
 
+# Non-empty text field; stripping and length checks run in pydantic-core
+TextField = Annotated[str, StringConstraints(
+    strip_whitespace=True, min_length=1, max_length=100)]
+
+
 class PersonBase(BaseModel):
     """Base model for Person with common fields."""
-    name: str = Field(..., min_length=1, max_length=100,
-                      description="Full name of the person")
-    role: str = Field(..., min_length=1, max_length=100,
-                      description="Job role or title")
-    department: str = Field(..., min_length=1, max_length=100,
-                            description="Department or team")
+    name: TextField = Field(..., description="Full name of the person")
+    role: TextField = Field(..., description="Job role or title")
+    department: TextField = Field(..., description="Department or team")
     staffing_status: StaffingStatus = Field(...,
                                             description="Current staffing status")
 
-    @validator('name', 'role', 'department')
-    def validate_text_fields(cls, v):
-        """Validate that text fields are not empty or just whitespace."""
-        if not v or not v.strip():
-            raise ValueError(
-                'Field cannot be empty or contain only whitespace')
-        return v.strip()
-
 
 class PersonCreate(PersonBase):
     """Model for creating a new person."""
@@ -43,19 +37,11 @@ class PersonCreate(PersonBase):
 
 class PersonUpdate(BaseModel):
     """Model for updating an existing person. All fields are optional."""
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
-    role: Optional[str] = Field(None, min_length=1, max_length=100)
-    department: Optional[str] = Field(None, min_length=1, max_length=100)
+    name: Optional[TextField] = None
+    role: Optional[TextField] = None
+    department: Optional[TextField] = None
     staffing_status: Optional[StaffingStatus] = None
 
-    @validator('name', 'role', 'department')
-    def validate_text_fields(cls, v):
-        """Validate that text fields are not empty or just whitespace."""
-        if v is not None and (not v or not v.strip()):
-            raise ValueError(
-                'Field cannot be empty or contain only whitespace')
-        return v.strip() if v else v
-
 
 class Person(PersonBase):
     """Complete Person model with database fields."""
@@ -63,8 +49,8 @@ class Person(PersonBase):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
-    class Config:
-        from_attributes = True
+    # Rows built with model_construct on write paths are never re-validated
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False)
 
 
 class PersonResponse(BaseModel):
@@ -3,24 +3,29 @@ Beach API router for the Agentic Platform.
 Provides business logic to identify people currently on the beach.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Header, Response, status
 from datetime import datetime
-import aiosqlite
+from typing import Optional
 
 from app.models import BeachResponse
 from app.services import BeachService
-from app.database import get_db_connection
+from app.cache import ResponseCache, etag_matches, get_data_version
 
 router = APIRouter()
 
+# Encoded beach responses are reused for a short window between writes
+BEACH_CACHE_TTL_SECONDS = 2.0
+_beach_cache = ResponseCache(ttl=BEACH_CACHE_TTL_SECONDS)
+
 
 @router.get("/beach", response_model=BeachResponse)
-async def get_people_on_beach(db: aiosqlite.Connection = Depends(get_db_connection)):
+async def get_people_on_beach(if_none_match: Optional[str] = Header(None)):
     """
     Retrieve all people currently on the beach.
 
     People are considered "on the beach" if their staffing status is 'bench' or 'available'.
     This endpoint demonstrates business logic that spans database queries and data aggregation.
+    Responses are cached briefly and carry an ETag; a matching If-None-Match returns 304.
 
     Returns:
         BeachResponse: List of people on the beach with metadata
@@ -29,16 +34,33 @@ async def get_people_on_beach(db: aiosqlite.Connection = Depends(get_db_connecti
         HTTPException: 500 if database operation fails
     """
     try:
-        # Get people on the beach using the beach service
-        people_on_beach = await BeachService.get_people_on_beach()
-
-        return BeachResponse(
-            success=True,
-            message=f"Retrieved {len(people_on_beach)} people currently on the beach",
-            people_on_beach=people_on_beach,
-            total_count=len(people_on_beach),
-            last_updated=datetime.utcnow()
-        )
+        # Read before querying, so a write racing the query leaves the new
+        # entry already stale
+        version = await get_data_version()
+        cached = _beach_cache.get(version)
+        if cached is None:
+
+            # Get people on the beach using the beach service
+            people_on_beach = await BeachService.get_people_on_beach()
+
+            beach_response = BeachResponse(
+                success=True,
+                message=f"Retrieved {len(people_on_beach)} people currently on the beach",
+                people_on_beach=people_on_beach,
+                total_count=len(people_on_beach),
+                last_updated=datetime.utcnow()
+            )
+            # Hash only the people list so the weak ETag survives a refill
+            # with unchanged data; last_updated differs on every refill
+            cached = _beach_cache.set(
+                beach_response.model_dump_json().encode(), version,
+                etag_source=beach_response.model_dump_json(include={"people_on_beach"}).encode())
+
+        body, etag = cached
+        if etag_matches(etag, if_none_match):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
     except Exception as e:
         raise HTTPException(
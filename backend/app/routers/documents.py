@@ -5,8 +5,6 @@ Provides secure access to policy documents and static files.
 
 from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import FileResponse
-from typing import List
-import os
 from pathlib import Path
 
 router = APIRouter()
@@ -24,6 +22,35 @@ AVAILABLE_DOCUMENTS = {
     "security-policy.md": "Security Policy - Information security guidelines and requirements"
 }
 
+# Media type served for each allowed extension
+MEDIA_TYPES = {
+    ".md": "text/markdown",
+    ".txt": "text/plain",
+    ".pdf": "application/pdf",
+    ".doc": "application/msword",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+}
+
+# Resolve the whitelist once at import time. Only documents with an allowed
+# extension that resolve inside the policies directory are servable, so a
+# request filename is reduced to a dict lookup.
+_POLICIES_RESOLVED = POLICIES_DIR.resolve()
+_RESOLVED_FILES: dict[str, Path] = {
+    name: (POLICIES_DIR / name).resolve()
+    for name in AVAILABLE_DOCUMENTS
+    if Path(name).suffix.lower() in ALLOWED_EXTENSIONS
+    and (POLICIES_DIR / name).resolve().is_relative_to(_POLICIES_RESOLVED)
+}
+
+# Documents actually present on disk. The directory only changes at deploy
+# time, so it is scanned once here rather than on every list request.
+_POLICIES_DIR_FOUND = POLICIES_DIR.is_dir()
+_AVAILABLE_ON_DISK: dict[str, str] = {
+    name: description
+    for name, description in AVAILABLE_DOCUMENTS.items()
+    if (POLICIES_DIR / name).is_file()
+}
+
 
 @router.get("/docs")
 async def list_available_documents():
@@ -35,28 +62,16 @@ async def list_available_documents():
     """
     try:
         # Verify that the policies directory exists
-        if not POLICIES_DIR.exists():
+        if not _POLICIES_DIR_FOUND:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Policy documents directory not found"
             )
 
-        # Get actual files in the directory (excluding .gitkeep)
-        actual_files = []
-        for file_path in POLICIES_DIR.iterdir():
-            if file_path.is_file() and file_path.name != ".gitkeep":
-                actual_files.append(file_path.name)
-
-        # Build response with available documents
-        available_docs = {}
-        for filename, description in AVAILABLE_DOCUMENTS.items():
-            if filename in actual_files:
-                available_docs[filename] = description
-
         return {
             "success": True,
-            "message": f"Found {len(available_docs)} available policy documents",
-            "documents": available_docs,
+            "message": f"Found {len(_AVAILABLE_ON_DISK)} available policy documents",
+            "documents": _AVAILABLE_ON_DISK,
             "base_url": "/api/docs/"
         }
 
@@ -81,87 +96,33 @@ async def get_document(filename: str):
         FileResponse: The requested document file
 
     Raises:
-        HTTPException: 400 for invalid filename, 404 if file not found, 403 for security violations
+        HTTPException: 404 if the document is not whitelisted or not on disk
     """
-    try:
-        # Input validation - check for path traversal attempts
-        if ".." in filename or "/" in filename or "\\" in filename:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid filename: path traversal not allowed"
-            )
-
-        # Validate file extension for security
-        file_extension = Path(filename).suffix.lower()
-        if file_extension not in ALLOWED_EXTENSIONS:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"File type not allowed. Allowed extensions: {', '.join(ALLOWED_EXTENSIONS)}"
-            )
-
-        # Check if filename is in our allowed documents list
-        if filename not in AVAILABLE_DOCUMENTS:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Document '{filename}' not found. Use /api/docs to see available documents."
-            )
-
-        # Construct the full file path
-        file_path = POLICIES_DIR / filename
-
-        # Verify the file exists and is actually a file
-        if not file_path.exists():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Document file '{filename}' not found on disk"
-            )
-
-        if not file_path.is_file():
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"'{filename}' is not a valid file"
-            )
-
-        # Additional security check - ensure the resolved path is still within policies directory
-        try:
-            file_path.resolve().relative_to(POLICIES_DIR.resolve())
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied: file path outside allowed directory"
-            )
-
-        # Determine media type based on file extension
-        media_type_map = {
-            ".md": "text/markdown",
-            ".txt": "text/plain",
-            ".pdf": "application/pdf",
-            ".doc": "application/msword",
-            ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        }
-
-        media_type = media_type_map.get(
-            file_extension, "application/octet-stream")
-
-        # Return the file
-        return FileResponse(
-            path=str(file_path),
-            media_type=media_type,
-            filename=filename,
-            headers={
-                "Content-Disposition": f"inline; filename={filename}",
-                "Cache-Control": "public, max-age=3600"  # Cache for 1 hour
-            }
+    # Only precomputed whitelist entries are servable, which also rules
+    # out path traversal and disallowed extensions
+    file_path = _RESOLVED_FILES.get(filename)
+    if file_path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Document '{filename}' not found. Use /api/docs to see available documents."
         )
 
-    except HTTPException:
-        raise
-    except Exception as e:
+    if filename not in _AVAILABLE_ON_DISK:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve document: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Document file '{filename}' not found on disk"
         )
 
+    # Serve the pre-resolved path directly
+    return FileResponse(
+        path=file_path,
+        media_type=MEDIA_TYPES.get(file_path.suffix.lower(), "application/octet-stream"),
+        headers={
+            "Content-Disposition": f"inline; filename={filename}",
+            "Cache-Control": "public, max-age=3600"  # Cache for 1 hour
+        }
+    )
+
 
 @router.get("/docs/{filename}/info")
 async def get_document_info(filename: str):
@@ -175,33 +136,23 @@ async def get_document_info(filename: str):
         dict: Document metadata including size, modification time, and description
     """
     try:
-        # Input validation
-        if ".." in filename or "/" in filename or "\\" in filename:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid filename: path traversal not allowed"
-            )
-
-        # Check if filename is in our allowed documents list
-        if filename not in AVAILABLE_DOCUMENTS:
+        # Check if filename is in our precomputed whitelist
+        file_path = _RESOLVED_FILES.get(filename)
+        if file_path is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Document '{filename}' not found"
             )
 
-        # Construct the full file path
-        file_path = POLICIES_DIR / filename
-
-        # Verify the file exists
-        if not file_path.exists():
+        # Get file statistics
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Document file '{filename}' not found on disk"
             )
 
-        # Get file statistics
-        stat = file_path.stat()
-
         return {
             "success": True,
             "filename": filename,
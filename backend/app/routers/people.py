@@ -3,52 +3,66 @@ People management API router for the Agentic Platform.
 Provides CRUD operations for managing people data.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Header, Response, status
+from typing import List, Optional
 import aiosqlite
-from datetime import datetime
 
-from app.models import Person, PersonCreate, PersonUpdate, PersonResponse, PeopleListResponse
-from app.database import get_db_connection
+from app.cache import ResponseCache, bump_data_version, etag_matches, get_data_version
+from app.models import PersonCreate, PersonUpdate, PersonResponse, PeopleListResponse
+from app.services import _row_to_person
+from app.database import (
+    get_db_read, get_db_write, get_shared_pool,
+    SQL_LIST_PEOPLE, SQL_GET_PERSON, SQL_INSERT_PERSON, SQL_UPDATE_PERSON, SQL_DELETE_PERSON
+)
 
 router = APIRouter()
 
+# Number of rows pulled from SQLite per fetchmany() call when listing people
+FETCH_BATCH_SIZE = 500
+
+# Encoded people listings are reused for a short window between writes
+PEOPLE_CACHE_TTL_SECONDS = 2.0
+_people_cache = ResponseCache(ttl=PEOPLE_CACHE_TTL_SECONDS)
+
 
 @router.get("/people", response_model=PeopleListResponse)
-async def get_all_people(db: aiosqlite.Connection = Depends(get_db_connection)):
+async def get_all_people(if_none_match: Optional[str] = Header(None)):
     """
     Retrieve all people from the database.
+    Responses are cached briefly and carry an ETag; a matching If-None-Match returns 304.
 
     Returns:
         PeopleListResponse: List of all people with total count
     """
     try:
-        cursor = await db.execute("""
-            SELECT id, name, role, department, staffing_status, created_at, updated_at 
-            FROM people 
-            ORDER BY created_at DESC
-        """)
-        rows = await cursor.fetchall()
-
-        people = []
-        for row in rows:
-            person = Person(
-                id=row["id"],
-                name=row["name"],
-                role=row["role"],
-                department=row["department"],
-                staffing_status=row["staffing_status"],
-                created_at=datetime.fromisoformat(row["created_at"]),
-                updated_at=datetime.fromisoformat(row["updated_at"])
+        # Read before querying, so a write racing the query leaves the new
+        # entry already stale
+        version = await get_data_version()
+        cached = _people_cache.get(version)
+        if cached is None:
+
+            # Borrow a pooled reader only on a miss, so cached hits never
+            # wait for a free connection
+            people = []
+            async with (await get_shared_pool()).reader() as db:
+                cursor = await db.execute(SQL_LIST_PEOPLE)
+                while batch := await cursor.fetchmany(FETCH_BATCH_SIZE):
+                    people.extend(_row_to_person(row) for row in batch)
+
+            people_response = PeopleListResponse(
+                success=True,
+                message=f"Retrieved {len(people)} people successfully",
+                people=people,
+                total_count=len(people)
             )
-            people.append(person)
+            cached = _people_cache.set(
+                people_response.model_dump_json().encode(), version)
 
-        return PeopleListResponse(
-            success=True,
-            message=f"Retrieved {len(people)} people successfully",
-            people=people,
-            total_count=len(people)
-        )
+        body, etag = cached
+        if etag_matches(etag, if_none_match):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
     except Exception as e:
         raise HTTPException(
@@ -58,7 +72,7 @@ async def get_all_people(db: aiosqlite.Connection = Depends(get_db_connection)):
 
 
 @router.post("/people", response_model=PersonResponse, status_code=status.HTTP_201_CREATED)
-async def create_person(person_data: PersonCreate, db: aiosqlite.Connection = Depends(get_db_connection)):
+async def create_person(person_data: PersonCreate, db: aiosqlite.Connection = Depends(get_db_write)):
     """
     Create a new person in the database.
 
@@ -69,29 +83,15 @@ async def create_person(person_data: PersonCreate, db: aiosqlite.Connection = De
         PersonResponse: Created person data with success status
     """
     try:
-        current_time = datetime.now().isoformat()
-
-        cursor = await db.execute("""
-            INSERT INTO people (name, role, department, staffing_status, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
+        # created_at/updated_at are set from SQL_NOW inside the statement
+        cursor = await db.execute(SQL_INSERT_PERSON, (
             person_data.name,
             person_data.role,
             person_data.department,
-            person_data.staffing_status.value,
-            current_time,
-            current_time
+            person_data.staffing_status.value
         ))
-
-        await db.commit()
-        person_id = cursor.lastrowid
-
-        # Retrieve the created person
-        cursor = await db.execute("""
-            SELECT id, name, role, department, staffing_status, created_at, updated_at 
-            FROM people WHERE id = ?
-        """, (person_id,))
         row = await cursor.fetchone()
+        bump_data_version()
 
         if not row:
             raise HTTPException(
@@ -99,15 +99,8 @@ async def create_person(person_data: PersonCreate, db: aiosqlite.Connection = De
                 detail="Failed to retrieve created person"
             )
 
-        created_person = Person(
-            id=row["id"],
-            name=row["name"],
-            role=row["role"],
-            department=row["department"],
-            staffing_status=row["staffing_status"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"])
-        )
+        # Input was validated by PersonCreate; skip re-validating the DB row
+        created_person = _row_to_person(row)
 
         return PersonResponse(
             success=True,
@@ -116,7 +109,6 @@ async def create_person(person_data: PersonCreate, db: aiosqlite.Connection = De
         )
 
     except Exception as e:
-        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create person: {str(e)}"
@@ -124,7 +116,7 @@ async def create_person(person_data: PersonCreate, db: aiosqlite.Connection = De
 
 
 @router.get("/people/{person_id}", response_model=PersonResponse)
-async def get_person_by_id(person_id: int, db: aiosqlite.Connection = Depends(get_db_connection)):
+async def get_person_by_id(person_id: int, db: aiosqlite.Connection = Depends(get_db_read)):
     """
     Retrieve a specific person by their ID.
 
@@ -138,10 +130,7 @@ async def get_person_by_id(person_id: int, db: aiosqlite.Connection = Depends(ge
         HTTPException: 404 if person not found
     """
     try:
-        cursor = await db.execute("""
-            SELECT id, name, role, department, staffing_status, created_at, updated_at 
-            FROM people WHERE id = ?
-        """, (person_id,))
+        cursor = await db.execute(SQL_GET_PERSON, (person_id,))
         row = await cursor.fetchone()
 
         if not row:
@@ -150,15 +139,7 @@ async def get_person_by_id(person_id: int, db: aiosqlite.Connection = Depends(ge
                 detail=f"Person with ID {person_id} not found"
             )
 
-        person = Person(
-            id=row["id"],
-            name=row["name"],
-            role=row["role"],
-            department=row["department"],
-            staffing_status=row["staffing_status"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"])
-        )
+        person = _row_to_person(row)
 
         return PersonResponse(
             success=True,
@@ -176,7 +157,7 @@ async def get_person_by_id(person_id: int, db: aiosqlite.Connection = Depends(ge
 
 
 @router.put("/people/{person_id}", response_model=PersonResponse)
-async def update_person(person_id: int, person_data: PersonUpdate, db: aiosqlite.Connection = Depends(get_db_connection)):
+async def update_person(person_id: int, person_data: PersonUpdate, db: aiosqlite.Connection = Depends(get_db_write)):
     """
     Update an existing person's information.
 
@@ -191,66 +172,32 @@ async def update_person(person_id: int, person_data: PersonUpdate, db: aiosqlite
         HTTPException: 404 if person not found
     """
     try:
-        # First check if person exists
-        cursor = await db.execute("SELECT id FROM people WHERE id = ?", (person_id,))
-        if not await cursor.fetchone():
+        if not person_data.model_dump(exclude_none=True):
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Person with ID {person_id} not found"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No fields provided for update"
             )
 
-        # Build dynamic update query based on provided fields
-        update_fields = []
-        update_values = []
-
-        if person_data.name is not None:
-            update_fields.append("name = ?")
-            update_values.append(person_data.name)
-
-        if person_data.role is not None:
-            update_fields.append("role = ?")
-            update_values.append(person_data.role)
-
-        if person_data.department is not None:
-            update_fields.append("department = ?")
-            update_values.append(person_data.department)
-
-        if person_data.staffing_status is not None:
-            update_fields.append("staffing_status = ?")
-            update_values.append(person_data.staffing_status.value)
+        # Fixed UPDATE statement: COALESCE keeps columns that were not provided,
+        # and an empty RETURNING result means the person does not exist
+        cursor = await db.execute(SQL_UPDATE_PERSON, (
+            person_data.name,
+            person_data.role,
+            person_data.department,
+            person_data.staffing_status.value if person_data.staffing_status else None,
+            person_id
+        ))
+        row = await cursor.fetchone()
 
-        if not update_fields:
+        if not row:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No fields provided for update"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Person with ID {person_id} not found"
             )
 
-        # Add updated_at timestamp
-        update_fields.append("updated_at = ?")
-        update_values.append(datetime.now().isoformat())
-        update_values.append(person_id)
-
-        # Execute update
-        update_query = f"UPDATE people SET {', '.join(update_fields)} WHERE id = ?"
-        await db.execute(update_query, update_values)
-        await db.commit()
-
-        # Retrieve updated person
-        cursor = await db.execute("""
-            SELECT id, name, role, department, staffing_status, created_at, updated_at 
-            FROM people WHERE id = ?
-        """, (person_id,))
-        row = await cursor.fetchone()
+        bump_data_version()
 
-        updated_person = Person(
-            id=row["id"],
-            name=row["name"],
-            role=row["role"],
-            department=row["department"],
-            staffing_status=row["staffing_status"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"])
-        )
+        updated_person = _row_to_person(row)
 
         return PersonResponse(
             success=True,
@@ -261,7 +208,6 @@ async def update_person(person_id: int, person_data: PersonUpdate, db: aiosqlite
     except HTTPException:
         raise
     except Exception as e:
-        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update person: {str(e)}"
@@ -269,7 +215,7 @@ async def update_person(person_id: int, person_data: PersonUpdate, db: aiosqlite
 
 
 @router.delete("/people/{person_id}", response_model=PersonResponse)
-async def delete_person(person_id: int, db: aiosqlite.Connection = Depends(get_db_connection)):
+async def delete_person(person_id: int, db: aiosqlite.Connection = Depends(get_db_write)):
     """
     Delete a person from the database.
 
@@ -283,11 +229,8 @@ async def delete_person(person_id: int, db: aiosqlite.Connection = Depends(get_d
         HTTPException: 404 if person not found
     """
     try:
-        # First retrieve the person to return in response
-        cursor = await db.execute("""
-            SELECT id, name, role, department, staffing_status, created_at, updated_at 
-            FROM people WHERE id = ?
-        """, (person_id,))
+        # Delete the person, getting the removed row back in the same statement
+        cursor = await db.execute(SQL_DELETE_PERSON, (person_id,))
         row = await cursor.fetchone()
 
         if not row:
@@ -296,19 +239,8 @@ async def delete_person(person_id: int, db: aiosqlite.Connection = Depends(get_d
                 detail=f"Person with ID {person_id} not found"
             )
 
-        deleted_person = Person(
-            id=row["id"],
-            name=row["name"],
-            role=row["role"],
-            department=row["department"],
-            staffing_status=row["staffing_status"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"])
-        )
-
-        # Delete the person
-        await db.execute("DELETE FROM people WHERE id = ?", (person_id,))
-        await db.commit()
+        bump_data_version()
+        deleted_person = _row_to_person(row)
 
         return PersonResponse(
             success=True,
@@ -319,7 +251,6 @@ async def delete_person(person_id: int, db: aiosqlite.Connection = Depends(get_d
     except HTTPException:
         raise
     except Exception as e:
-        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete person: {str(e)}"
@@ -5,182 +5,81 @@ Provides sample people data with various staffing statuses for development and t
 
 import asyncio
 import aiosqlite
-from datetime import datetime
-from app.database import DATABASE_PATH, init_database
+from typing import Tuple
+from app.database import DATABASE_PATH, SQL_NOW, apply_pragmas, init_database
 from app.models import StaffingStatus
 
 
-# Sample people data with diverse roles, departments, and staffing statuses
-SAMPLE_PEOPLE = [
+# Sample people data with diverse roles, departments, and staffing statuses,
+# stored as (name, role, department, staffing_status) rows ready for executemany
+SAMPLE_PEOPLE_ROWS: Tuple[Tuple[str, str, str, str], ...] = (
     # Engineering Department - Mix of staffed and available
-    {
-        "name": "Alice Johnson",
-        "role": "Senior Software Engineer",
-        "department": "Engineering",
-        "staffing_status": StaffingStatus.STAFFED
-    },
-    {
-        "name": "Bob Chen",
-        "role": "Frontend Developer",
-        "department": "Engineering",
-        "staffing_status": StaffingStatus.BENCH
-    },
-    {
-        "name": "Carol Martinez",
-        "role": "DevOps Engineer",
-        "department": "Engineering",
-        "staffing_status": StaffingStatus.AVAILABLE
-    },
-    {
-        "name": "David Kim",
-        "role": "Full Stack Developer",
-        "department": "Engineering",
-        "staffing_status": StaffingStatus.STAFFED
-    },
-    {
-        "name": "Eva Rodriguez",
-        "role": "Backend Engineer",
-        "department": "Engineering",
-        "staffing_status": StaffingStatus.BENCH
-    },
+    ("Alice Johnson", "Senior Software Engineer", "Engineering", StaffingStatus.STAFFED.value),
+    ("Bob Chen", "Frontend Developer", "Engineering", StaffingStatus.BENCH.value),
+    ("Carol Martinez", "DevOps Engineer", "Engineering", StaffingStatus.AVAILABLE.value),
+    ("David Kim", "Full Stack Developer", "Engineering", StaffingStatus.STAFFED.value),
+    ("Eva Rodriguez", "Backend Engineer", "Engineering", StaffingStatus.BENCH.value),
 
     # Product Department
-    {
-        "name": "Frank Wilson",
-        "role": "Product Manager",
-        "department": "Product",
-        "staffing_status": StaffingStatus.STAFFED
-    },
-    {
-        "name": "Grace Lee",
-        "role": "UX Designer",
-        "department": "Product",
-        "staffing_status": StaffingStatus.AVAILABLE
-    },
-    {
-        "name": "Henry Thompson",
-        "role": "Product Analyst",
-        "department": "Product",
-        "staffing_status": StaffingStatus.BENCH
-    },
+    ("Frank Wilson", "Product Manager", "Product", StaffingStatus.STAFFED.value),
+    ("Grace Lee", "UX Designer", "Product", StaffingStatus.AVAILABLE.value),
+    ("Henry Thompson", "Product Analyst", "Product", StaffingStatus.BENCH.value),
 
     # Data Science Department
-    {
-        "name": "Iris Patel",
-        "role": "Data Scientist",
-        "department": "Data Science",
-        "staffing_status": StaffingStatus.STAFFED
-    },
-    {
-        "name": "Jack Brown",
-        "role": "ML Engineer",
-        "department": "Data Science",
-        "staffing_status": StaffingStatus.AVAILABLE
-    },
-    {
-        "name": "Kate Singh",
-        "role": "Data Analyst",
-        "department": "Data Science",
-        "staffing_status": StaffingStatus.BENCH
-    },
+    ("Iris Patel", "Data Scientist", "Data Science", StaffingStatus.STAFFED.value),
+    ("Jack Brown", "ML Engineer", "Data Science", StaffingStatus.AVAILABLE.value),
+    ("Kate Singh", "Data Analyst", "Data Science", StaffingStatus.BENCH.value),
 
     # Marketing Department
-    {
-        "name": "Liam Davis",
-        "role": "Marketing Manager",
-        "department": "Marketing",
-        "staffing_status": StaffingStatus.STAFFED
-    },
-    {
-        "name": "Maya Gonzalez",
-        "role": "Content Strategist",
-        "department": "Marketing",
-        "staffing_status": StaffingStatus.AVAILABLE
-    },
+    ("Liam Davis", "Marketing Manager", "Marketing", StaffingStatus.STAFFED.value),
+    ("Maya Gonzalez", "Content Strategist", "Marketing", StaffingStatus.AVAILABLE.value),
 
     # Sales Department
-    {
-        "name": "Noah Miller",
-        "role": "Sales Representative",
-        "department": "Sales",
-        "staffing_status": StaffingStatus.STAFFED
-    },
-    {
-        "name": "Olivia Taylor",
-        "role": "Account Manager",
-        "department": "Sales",
-        "staffing_status": StaffingStatus.BENCH
-    },
+    ("Noah Miller", "Sales Representative", "Sales", StaffingStatus.STAFFED.value),
+    ("Olivia Taylor", "Account Manager", "Sales", StaffingStatus.BENCH.value),
 
     # HR Department
-    {
-        "name": "Paul Anderson",
-        "role": "HR Business Partner",
-        "department": "Human Resources",
-        "staffing_status": StaffingStatus.STAFFED
-    },
-    {
-        "name": "Quinn White",
-        "role": "Recruiter",
-        "department": "Human Resources",
-        "staffing_status": StaffingStatus.AVAILABLE
-    },
+    ("Paul Anderson", "HR Business Partner", "Human Resources", StaffingStatus.STAFFED.value),
+    ("Quinn White", "Recruiter", "Human Resources", StaffingStatus.AVAILABLE.value),
 
     # Finance Department
-    {
-        "name": "Rachel Green",
-        "role": "Financial Analyst",
-        "department": "Finance",
-        "staffing_status": StaffingStatus.STAFFED
-    },
-    {
-        "name": "Sam Cooper",
-        "role": "Accounting Specialist",
-        "department": "Finance",
-        "staffing_status": StaffingStatus.BENCH
-    },
+    ("Rachel Green", "Financial Analyst", "Finance", StaffingStatus.STAFFED.value),
+    ("Sam Cooper", "Accounting Specialist", "Finance", StaffingStatus.BENCH.value),
 
     # Operations Department
-    {
-        "name": "Tina Clark",
-        "role": "Operations Manager",
-        "department": "Operations",
-        "staffing_status": StaffingStatus.STAFFED
-    }
-]
+    ("Tina Clark", "Operations Manager", "Operations", StaffingStatus.STAFFED.value),
+)
 
 
 async def clear_existing_data():
     """Clear existing people data from the database."""
-    async with aiosqlite.connect(DATABASE_PATH) as db:
+    async with aiosqlite.connect(DATABASE_PATH, isolation_level=None) as db:
+        await apply_pragmas(db)
+        await db.execute("BEGIN IMMEDIATE")
         await db.execute("DELETE FROM people")
-        await db.commit()
+        await db.execute("COMMIT")
         print("Cleared existing people data")
 
 
 async def seed_people_data():
     """Insert sample people data into the database."""
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        current_time = datetime.now().isoformat()
-
-        for person_data in SAMPLE_PEOPLE:
-            await db.execute(
-                """
-                INSERT INTO people (name, role, department, staffing_status, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    person_data["name"],
-                    person_data["role"],
-                    person_data["department"],
-                    person_data["staffing_status"].value,
-                    current_time,
-                    current_time
-                )
-            )
-
-        await db.commit()
-        print(f"Successfully seeded {len(SAMPLE_PEOPLE)} people records")
+    async with aiosqlite.connect(DATABASE_PATH, isolation_level=None) as db:
+        await apply_pragmas(db)
+        # Insert all rows in one explicit write transaction, with a single
+        # call instead of one round trip per row
+        await db.execute("BEGIN IMMEDIATE")
+        await db.executemany(
+            f"""
+            INSERT INTO people (name, role, department, staffing_status, created_at, updated_at)
+            VALUES (?, ?, ?, ?, {SQL_NOW}, {SQL_NOW})
+            """,
+            SAMPLE_PEOPLE_ROWS
+        )
+        await db.execute("COMMIT")
+
+        # Refresh planner statistics for the freshly loaded rows
+        await db.execute("ANALYZE;")
+        print(f"Successfully seeded {len(SAMPLE_PEOPLE_ROWS)} people records")
 
 
 async def verify_seeded_data():
@@ -196,11 +95,9 @@ async def verify_seeded_data():
         )
         status_counts = await cursor.fetchall()
 
-        print(f"\nData verification:")
-        print(f"Total people: {total_count}")
-        print("By staffing status:")
-        for status, count in status_counts:
-            print(f"  {status}: {count}")
+        # Build the whole report first and write it with a single print
+        lines = ["\nData verification:", f"Total people: {total_count}", "By staffing status:"]
+        lines.extend(f"  {status}: {count}" for status, count in status_counts)
 
         # Show people on the beach (bench + available)
         cursor = await db.execute(
@@ -213,22 +110,26 @@ async def verify_seeded_data():
         )
         beach_people = await cursor.fetchall()
 
-        print(f"\nPeople on the beach ({len(beach_people)}):")
-        for person in beach_people:
-            print(f"  {person[0]} - {person[1]} ({person[2]}) - {person[3]}")
+        lines.append(f"\nPeople on the beach ({len(beach_people)}):")
+        lines.extend(f"  {p[0]} - {p[1]} ({p[2]}) - {p[3]}" for p in beach_people)
+        print("\n".join(lines))
 
 
-async def seed_database(clear_existing: bool = True):
+async def seed_database(clear_existing: bool = True, verify: bool = False):
     """
     Main function to seed the database with sample data.
 
     Args:
         clear_existing: Whether to clear existing data before seeding
+        verify: Whether to query and print the seeded data afterwards
     """
     print("Starting database seeding...")
 
-    # Initialize database schema
-    await init_database()
+    # Initialize database schema on a plain writer connection; seeding does
+    # not need the pool of request-serving connections
+    async with aiosqlite.connect(DATABASE_PATH, isolation_level=None) as db:
+        await apply_pragmas(db)
+        await init_database(db)
     print("Database initialized")
 
     # Clear existing data if requested
@@ -238,8 +139,9 @@ async def seed_database(clear_existing: bool = True):
     # Seed new data
     await seed_people_data()
 
-    # Verify the seeded data
-    await verify_seeded_data()
+    # Verify the seeded data if requested
+    if verify:
+        await verify_seeded_data()
 
     print("\nDatabase seeding completed successfully!")
 
@@ -4,11 +4,34 @@ Implements CRUD operations for People and other business logic.
 """
 
 import aiosqlite
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
-from app.database import get_database
-from app.models import Person, PersonCreate, PersonUpdate, BeachResponse
+from app.cache import bump_data_version
+from app.database import (
+    get_shared_db, get_shared_pool,
+    SQL_GET_PERSON, SQL_LIST_PEOPLE, SQL_PEOPLE_BY_STATUS, SQL_INSERT_PERSON,
+    SQL_UPDATE_PERSON, SQL_DELETE_PERSON, SQL_BEACH, SQL_COUNTS
+)
+from app.models import Person, PersonCreate, PersonUpdate, BeachResponse, StaffingStatus
+
+
+def _row_to_person(row: aiosqlite.Row) -> Person:
+    """
+    Build a Person from a people row without re-running validation.
+    Rows come straight from the database, so the field validators are skipped;
+    the ISO 8601 timestamp text is parsed here rather than by a global
+    sqlite3 converter.
+    """
+    return Person.model_construct(
+        id=row['id'],
+        name=row['name'],
+        role=row['role'],
+        department=row['department'],
+        staffing_status=StaffingStatus(row['staffing_status']),
+        created_at=datetime.fromisoformat(row['created_at']),
+        updated_at=datetime.fromisoformat(row['updated_at'])
+    )
 
 
 class PeopleService:
@@ -28,26 +51,22 @@ class PeopleService:
         Raises:
             Exception: If database operation fails
         """
-        async with get_database() as db:
-            cursor = await db.execute(
-                """
-                INSERT INTO people (name, role, department, staffing_status, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    person_data.name,
-                    person_data.role,
-                    person_data.department,
-                    person_data.staffing_status.value,
-                    datetime.utcnow(),
-                    datetime.utcnow()
-                )
+        # Both timestamps come from SQL_NOW within the one statement, so
+        # created_at == updated_at on insert
+        db = await get_shared_db()
+        cursor = await db.execute(
+            SQL_INSERT_PERSON,
+            (
+                person_data.name,
+                person_data.role,
+                person_data.department,
+                person_data.staffing_status.value
             )
-            await db.commit()
+        )
+        row = await cursor.fetchone()
+        bump_data_version()
 
-            # Get the created person
-            person_id = cursor.lastrowid
-            return await PeopleService.get_person_by_id(person_id)
+        return _row_to_person(row)
 
     @staticmethod
     async def get_person_by_id(person_id: int) -> Optional[Person]:
@@ -60,24 +79,13 @@ class PeopleService:
         Returns:
             Person or None if not found
         """
-        async with get_database() as db:
-            cursor = await db.execute(
-                "SELECT * FROM people WHERE id = ?",
-                (person_id,)
-            )
-            row = await cursor.fetchone()
+        db = await get_shared_db()
+        cursor = await db.execute(SQL_GET_PERSON, (person_id,))
+        row = await cursor.fetchone()
 
-            if row:
-                return Person(
-                    id=row['id'],
-                    name=row['name'],
-                    role=row['role'],
-                    department=row['department'],
-                    staffing_status=row['staffing_status'],
-                    created_at=row['created_at'],
-                    updated_at=row['updated_at']
-                )
-            return None
+        if row:
+            return _row_to_person(row)
+        return None
 
     @staticmethod
     async def get_all_people() -> List[Person]:
@@ -87,24 +95,10 @@ class PeopleService:
         Returns:
             List of Person objects
         """
-        async with get_database() as db:
-            cursor = await db.execute(
-                "SELECT * FROM people ORDER BY created_at DESC"
-            )
-            rows = await cursor.fetchall()
-
-            return [
-                Person(
-                    id=row['id'],
-                    name=row['name'],
-                    role=row['role'],
-                    department=row['department'],
-                    staffing_status=row['staffing_status'],
-                    created_at=row['created_at'],
-                    updated_at=row['updated_at']
-                )
-                for row in rows
-            ]
+        pool = await get_shared_pool()
+        async with pool.reader() as db:
+            cursor = await db.execute(SQL_LIST_PEOPLE)
+            return [_row_to_person(row) async for row in cursor]
 
     @staticmethod
     async def update_person(person_id: int, person_data: PersonUpdate) -> Optional[Person]:
@@ -118,47 +112,26 @@ class PeopleService:
         Returns:
             Updated Person or None if not found
         """
-        # First check if person exists
-        existing_person = await PeopleService.get_person_by_id(person_id)
-        if not existing_person:
-            return None
-
-        # Build update query dynamically based on provided fields
-        update_fields = []
-        update_values = []
-
-        if person_data.name is not None:
-            update_fields.append("name = ?")
-            update_values.append(person_data.name)
-
-        if person_data.role is not None:
-            update_fields.append("role = ?")
-            update_values.append(person_data.role)
-
-        if person_data.department is not None:
-            update_fields.append("department = ?")
-            update_values.append(person_data.department)
-
-        if person_data.staffing_status is not None:
-            update_fields.append("staffing_status = ?")
-            update_values.append(person_data.staffing_status.value)
-
-        # Always update the updated_at timestamp
-        update_fields.append("updated_at = ?")
-        update_values.append(datetime.utcnow())
-
-        # Add person_id for WHERE clause
-        update_values.append(person_id)
-
-        async with get_database() as db:
-            await db.execute(
-                f"UPDATE people SET {', '.join(update_fields)} WHERE id = ?",
-                update_values
+        # Fixed UPDATE statement: COALESCE keeps columns that were not provided,
+        # and an empty RETURNING result means the person does not exist
+        db = await get_shared_db()
+        cursor = await db.execute(
+            SQL_UPDATE_PERSON,
+            (
+                person_data.name,
+                person_data.role,
+                person_data.department,
+                person_data.staffing_status.value if person_data.staffing_status else None,
+                person_id
             )
-            await db.commit()
+        )
+        row = await cursor.fetchone()
 
-            # Return updated person
-            return await PeopleService.get_person_by_id(person_id)
+        if row is None:
+            return None
+
+        bump_data_version()
+        return _row_to_person(row)
 
     @staticmethod
     async def delete_person(person_id: int) -> bool:
@@ -171,14 +144,13 @@ class PeopleService:
         Returns:
             True if person was deleted, False if not found
         """
-        async with get_database() as db:
-            cursor = await db.execute(
-                "DELETE FROM people WHERE id = ?",
-                (person_id,)
-            )
-            await db.commit()
+        db = await get_shared_db()
+        cursor = await db.execute(SQL_DELETE_PERSON, (person_id,))
+        deleted = await cursor.fetchone() is not None
+        if deleted:
+            bump_data_version()
 
-            return cursor.rowcount > 0
+        return deleted
 
     @staticmethod
     async def get_people_by_staffing_status(status: str) -> List[Person]:
@@ -191,25 +163,10 @@ class PeopleService:
         Returns:
             List of Person objects with matching status
         """
-        async with get_database() as db:
-            cursor = await db.execute(
-                "SELECT * FROM people WHERE staffing_status = ? ORDER BY created_at DESC",
-                (status,)
-            )
-            rows = await cursor.fetchall()
-
-            return [
-                Person(
-                    id=row['id'],
-                    name=row['name'],
-                    role=row['role'],
-                    department=row['department'],
-                    staffing_status=row['staffing_status'],
-                    created_at=row['created_at'],
-                    updated_at=row['updated_at']
-                )
-                for row in rows
-            ]
+        pool = await get_shared_pool()
+        async with pool.reader() as db:
+            cursor = await db.execute(SQL_PEOPLE_BY_STATUS, (status,))
+            return [_row_to_person(row) async for row in cursor]
 
     @staticmethod
     async def get_people_count() -> int:
@@ -219,10 +176,23 @@ class PeopleService:
         Returns:
             Total number of people
         """
-        async with get_database() as db:
-            cursor = await db.execute("SELECT COUNT(*) as count FROM people")
+        total, _ = await PeopleService.get_counts()
+        return total
+
+    @staticmethod
+    async def get_counts() -> Tuple[int, int]:
+        """
+        Get the total and on-the-beach people counts with one query.
+        Callers needing both counts should use this directly.
+
+        Returns:
+            Tuple of (total number of people, number of people on the beach)
+        """
+        pool = await get_shared_pool()
+        async with pool.reader() as db:
+            cursor = await db.execute(SQL_COUNTS)
             row = await cursor.fetchone()
-            return row['count'] if row else 0
+            return (row['total'], row['beach_total']) if row else (0, 0)
 
 
 class BeachService:
@@ -240,27 +210,10 @@ class BeachService:
         Raises:
             Exception: If database operation fails
         """
-        async with get_database() as db:
-            cursor = await db.execute(
-                """
-                SELECT * FROM people 
-                WHERE staffing_status IN ('bench', 'available') 
-                ORDER BY created_at DESC
-                """)
-            rows = await cursor.fetchall()
-
-            return [
-                Person(
-                    id=row['id'],
-                    name=row['name'],
-                    role=row['role'],
-                    department=row['department'],
-                    staffing_status=row['staffing_status'],
-                    created_at=row['created_at'],
-                    updated_at=row['updated_at']
-                )
-                for row in rows
-            ]
+        pool = await get_shared_pool()
+        async with pool.reader() as db:
+            cursor = await db.execute(SQL_BEACH)
+            return [_row_to_person(row) async for row in cursor]
 
     @staticmethod
     async def get_beach_count() -> int:
@@ -270,9 +223,5 @@ class BeachService:
         Returns:
             Number of people with 'bench' or 'available' status
         """
-        async with get_database() as db:
-            cursor = await db.execute(
-                "SELECT COUNT(*) as count FROM people WHERE staffing_status IN ('bench', 'available')"
-            )
-            row = await cursor.fetchone()
-            return row['count'] if row else 0
+        _, beach_total = await PeopleService.get_counts()
+        return beach_total
@@ -1,14 +1,31 @@
 """
 Development server runner for the Agentic Platform backend.
+
+Set RELOAD=false to run without auto-reload in multiple worker processes
+(WEB_CONCURRENCY, defaulting to the CPU count), as used in the container.
+UVICORN_LOOP and UVICORN_HTTP override the event loop and HTTP parser; by
+default uvicorn picks uvloop and httptools when they are installed.
 """
 
+import os
+
 import uvicorn
 
 if __name__ == "__main__":
+    reload = os.getenv("RELOAD", "true").lower() == "true"
+
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        log_level="info"
+        # "auto" uses uvloop/httptools from uvicorn[standard] when available
+        # and falls back to asyncio/h11 elsewhere (e.g. Windows)
+        loop=os.getenv("UVICORN_LOOP", "auto"),
+        http=os.getenv("UVICORN_HTTP", "auto"),
+        reload=reload,
+        # Each worker opens its own connection pool; SQLite WAL supports
+        # readers across processes
+        workers=None if reload else int(
+            os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        log_level="info" if reload else "warning"
     )
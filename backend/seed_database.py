@@ -4,11 +4,12 @@ Standalone script to seed the Agentic Platform database with sample data.
 Can be run from the backend directory to populate the database for development.
 
 Usage:
-    python seed_database.py [--clear]
+    python seed_database.py [--clear] [--verify]
     
 Options:
     --clear: Clear existing data before seeding (default: True)
     --no-clear: Keep existing data and add sample data
+    --verify: Print counts and people on the beach after seeding
 """
 
 from app.seed_data import seed_database
@@ -31,6 +32,11 @@ def main():
         action="store_true",
         help="Keep existing data and add sample data (default: clear existing data)"
     )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Print a summary of the seeded data (default: skip verification queries)"
+    )
 
     args = parser.parse_args()
 
@@ -39,7 +45,8 @@ def main():
 
     try:
         # Run the seeding process
-        asyncio.run(seed_database(clear_existing=clear_existing))
+        asyncio.run(seed_database(
+            clear_existing=clear_existing, verify=args.verify))
         print("\n✅ Database seeding completed successfully!")
 
     except Exception as e:
@@ -5,6 +5,7 @@ Tests all major API endpoints and verifies CORS configuration.
 """
 
 from fastapi.testclient import TestClient
+from typing import Optional
 from app.database import DATABASE_PATH
 from app.main import app
 import asyncio
@@ -15,6 +16,15 @@ from pathlib import Path
 # Add the app directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# TestClient shared by the checks while main() runs; it is opened there, so
+# importing this module starts nothing
+_client: Optional[TestClient] = None
+
+
+def get_client() -> TestClient:
+    """Return the client opened by main(), or a fresh one for a standalone check."""
+    return _client if _client is not None else TestClient(app)
+
 
 def test_cors_configuration():
     """Test CORS configuration in the FastAPI app."""
@@ -39,7 +49,7 @@ def test_api_endpoints():
     """Test all API endpoints with sample data."""
     print("\nTesting API endpoints...")
 
-    client = TestClient(app)
+    client = get_client()
 
     # Test root endpoint
     try:
@@ -114,7 +124,7 @@ def test_people_crud_operations():
     """Test CRUD operations for people."""
     print("\nTesting People CRUD operations...")
 
-    client = TestClient(app)
+    client = get_client()
 
     # Test creating a person
     test_person = {
@@ -197,7 +207,7 @@ def test_cors_headers():
     """Test CORS headers in API responses."""
     print("\nTesting CORS headers...")
 
-    client = TestClient(app)
+    client = get_client()
 
     # Test preflight request
     try:
@@ -232,28 +242,26 @@ async def main():
     """Run all integration tests."""
     print("🚀 Starting Agentic Platform Integration Tests\n")
 
-    tests_passed = 0
     total_tests = 5
 
-    # Test 1: CORS Configuration
-    if test_cors_configuration():
-        tests_passed += 1
-
-    # Test 2: Database Data
-    if await verify_database_data():
-        tests_passed += 1
-
-    # Test 3: API Endpoints
-    if test_api_endpoints():
-        tests_passed += 1
-
-    # Test 4: CRUD Operations
-    if test_people_crud_operations():
-        tests_passed += 1
-
-    # Test 5: CORS Headers
-    if test_cors_headers():
-        tests_passed += 1
+    # Run the checks one after another so each one's output stays together;
+    # the CRUD check inserts and deletes a row, so it runs after the counts.
+    # One client, opened with the app lifespan, is shared by every check.
+    global _client
+    with TestClient(app) as client:
+        _client = client
+        try:
+            results = [
+                test_cors_configuration(),
+                await verify_database_data(),
+                test_api_endpoints(),
+                test_cors_headers(),
+                test_people_crud_operations()
+            ]
+        finally:
+            _client = None
+
+    tests_passed = sum(1 for passed in results if passed)
 
     print(f"\n📊 Test Results: {tests_passed}/{total_tests} tests passed")
 